@@ -1,26 +1,88 @@
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
+from typing import Annotated, Any, Dict, FrozenSet, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
 
 from app.db.session import DbSession
-from app.schemas.pokemon import Pokemon, PokemonList
+from app.models.pokemon import Pokemon as PokemonModel
+from app.schemas.pokemon import (
+    POKEMON_FIELDS,
+    PendingPokemon,
+    Pokemon,
+    PokemonList,
+    pokemon_fields_model,
+)
 from app.services.pokemon import PokemonService
+from app.services.write_behind import write_behind_queue
 
 router = APIRouter(prefix="/pokemon", tags=["pokemon"])
 
 
-@router.get("/{pokemon_id}", response_model=Pokemon)
+def get_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated list of Pokemon fields to return "
+        "(e.g. pokemon_id,name,types). Defaults to all fields.",
+    ),
+) -> Optional[FrozenSet[str]]:
+    """Parse and validate the sparse fieldset query parameter."""
+    if fields is None:
+        return None
+    
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if not requested:
+        raise HTTPException(status_code=400, detail="fields must not be empty")
+    
+    unknown = requested - set(POKEMON_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed fields: {', '.join(POKEMON_FIELDS)}"
+        )
+    return requested
+
+
+# `Fields` is the parsed `fields=` query parameter (None means all fields).
+Fields = Annotated[Optional[FrozenSet[str]], Depends(get_fields)]
+
+# The response model documents the full schema; note the sparse variant.
+SPARSE_FIELDS_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "Successful Response. When `fields=` is given, each "
+        "Pokemon object contains only the requested keys."
+    },
+    400: {"description": "Unknown or empty `fields=` selection"},
+}
+
+
+def sparse_pokemon(pokemon: PokemonModel, fields: FrozenSet[str]) -> Dict[str, Any]:
+    """Serialize only the requested fields of a Pokemon."""
+    base = PendingPokemon if pokemon.id is None else Pokemon
+    model = pokemon_fields_model(fields, base)
+    return model.model_validate(pokemon).model_dump(mode="json")
+
+
+@router.get(
+    "/{pokemon_id}",
+    response_model=Union[Pokemon, PendingPokemon],
+    responses=SPARSE_FIELDS_RESPONSES,
+)
 async def get_pokemon(
     db: DbSession,
     pokemon_id: int,
-) -> Pokemon:
+    fields: Fields,
+) -> Union[Pokemon, PendingPokemon, Response]:
     """
     Get a Pokemon by ID.
     
     If the Pokemon doesn't exist in the database, it will be fetched
-    from the PokeAPI and stored for future use.
+    from the PokeAPI and stored for future use. With write-behind enabled
+    the response is returned before the new row is persisted.
     """
-    service = PokemonService(db)    
-    pokemon = await service.get_or_fetch_pokemon(pokemon_id)
+    service = PokemonService(
+        db, write_behind=write_behind_queue if write_behind_queue.running else None
+    )
+    pokemon = await service.get_or_fetch_pokemon(pokemon_id, fields=fields)
     
     if not pokemon:
         raise HTTPException(
@@ -28,15 +90,18 @@ async def get_pokemon(
             detail=f"Pokemon with ID {pokemon_id} not found in DB or PokeAPI"
         )
     
+    if fields:
+        return JSONResponse(sparse_pokemon(pokemon, fields))
     return pokemon
 
 
-@router.get("/", response_model=PokemonList)
+@router.get("/", response_model=PokemonList, responses=SPARSE_FIELDS_RESPONSES)
 async def list_pokemon(
     db: DbSession,
+    fields: Fields,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
-) -> PokemonList:
+) -> Union[PokemonList, Response]:
     """
     List Pokemon with pagination.
     
@@ -46,7 +111,17 @@ async def list_pokemon(
     service = PokemonService(db)
     skip = (page - 1) * size
     
-    pokemon_list, total = await service.get_pokemon_list(skip=skip, limit=size)
+    pokemon_list, total = await service.get_pokemon_list(
+        skip=skip, limit=size, fields=fields
+    )
+    
+    if fields:
+        return JSONResponse({
+            "items": [sparse_pokemon(pokemon, fields) for pokemon in pokemon_list],
+            "total": total,
+            "page": page,
+            "size": size,
+        })
     
     return PokemonList(
         items=pokemon_list,
@@ -56,17 +131,20 @@ async def list_pokemon(
     )
 
 
-@router.get("/search/{name}", response_model=Pokemon)
+@router.get(
+    "/search/{name}", response_model=Pokemon, responses=SPARSE_FIELDS_RESPONSES
+)
 async def search_pokemon(
     name: str,
-    db: DbSession
-) -> Pokemon:
+    db: DbSession,
+    fields: Fields,
+) -> Union[Pokemon, Response]:
     """
     Search for a Pokemon by name in the local database (case-insensitive).
     Name should be the exact Pokemon name.
     """
     service = PokemonService(db)
-    pokemon = await service.search_pokemon_by_name(name)
+    pokemon = await service.search_pokemon_by_name(name, fields=fields)
     
     if not pokemon:
         raise HTTPException(
@@ -74,6 +152,8 @@ async def search_pokemon(
             detail=f"Pokemon with name '{name}' not found in database. Try fetching it first if it exists in PokeAPI."
         )
     
+    if fields:
+        return JSONResponse(sparse_pokemon(pokemon, fields))
     return pokemon
 
 
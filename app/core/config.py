@@ -24,6 +24,12 @@ class Settings(BaseSettings):
     
     # External APIs
     pokemon_api_base_url: str = "https://pokeapi.co/api/v2"
+
+    # Write-behind persistence for freshly fetched Pokemon
+    write_behind_enabled: bool = False
+    write_behind_max_size: int = 1000
+    write_behind_batch_size: int = 100
+    write_behind_flush_interval: float = 0.5
     
     # Server Settings
     host: str = "0.0.0.0"
@@ -6,6 +6,7 @@ from app.core.config import settings
 from app.api import pokemon
 from app.db.session import engine
 from app.db.base import Base
+from app.services.write_behind import write_behind_queue
 
 
 @asynccontextmanager
@@ -15,11 +16,16 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         # Create tables (for development, use Alembic in production)
         await conn.run_sync(Base.metadata.create_all)
+    if settings.write_behind_enabled:
+        await write_behind_queue.start()
     
     yield
     
     # Shutdown
-    await engine.dispose()
+    try:
+        await write_behind_queue.stop()
+    finally:
+        await engine.dispose()
 
 
 def create_app() -> FastAPI:
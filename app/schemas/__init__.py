@@ -4,10 +4,13 @@ from app.schemas.pokemon import (
     PokemonUpdate,
     PokemonInDB,
     Pokemon,
+    PendingPokemon,
     PokemonList,
     PokemonType,
     PokemonAbility,
     PokemonStat,
+    POKEMON_FIELDS,
+    pokemon_fields_model,
 )
 from app.schemas.user import User
 
@@ -17,9 +20,12 @@ __all__ = [
     "PokemonUpdate",
     "PokemonInDB",
     "Pokemon",
+    "PendingPokemon",
     "PokemonList",
     "PokemonType",
     "PokemonAbility",
     "PokemonStat",
+    "POKEMON_FIELDS",
+    "pokemon_fields_model",
     "User",
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, ConfigDict, HttpUrl
+from functools import lru_cache
+from typing import Optional, List, Dict, FrozenSet, Type
+from pydantic import BaseModel, Field, ConfigDict, HttpUrl, create_model
 
 
 # Helper model for common PokeAPI name-url pairs
@@ -75,9 +76,38 @@ class Pokemon(PokemonInDB):
     pass
 
 
+class PendingPokemon(PokemonBase):
+    """Schema for a Pokemon returned before its write-behind row is persisted"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: None = Field(default=None, description="Assigned once the row is persisted")
+    created_at: datetime
+    updated_at: datetime
+
+
 class PokemonList(BaseModel):
     """Schema for list of Pokemon with pagination"""
     items: List[Pokemon]
     total: int
     page: int = Field(default=1, ge=1)
-    size: int = Field(default=10, ge=1, le=100)
\ No newline at end of file
+    size: int = Field(default=10, ge=1, le=100)
+
+
+# Field names accepted by the `fields=` query parameter
+POKEMON_FIELDS = tuple(Pokemon.model_fields)
+
+
+@lru_cache(maxsize=128)
+def pokemon_fields_model(
+    fields: FrozenSet[str], base: Type[BaseModel] = Pokemon
+) -> Type[BaseModel]:
+    """Build (and cache) a response schema limited to `fields` of `base`"""
+    return create_model(
+        f"{base.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (field.annotation, field)
+            for name, field in base.model_fields.items()
+            if name in fields
+        },
+    )
\ No newline at end of file
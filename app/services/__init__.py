@@ -1,3 +1,4 @@
 from app.services.pokemon import PokemonService
+from app.services.snapshot import SnapshotService
 
-__all__ = ["PokemonService"]
\ No newline at end of file
+__all__ = ["PokemonService", "SnapshotService"]
\ No newline at end of file
@@ -1,19 +1,41 @@
 import httpx
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Collection, TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import Select, select, func
+from sqlalchemy.orm import load_only
 from app.core.config import settings
 from app.models.pokemon import Pokemon
 from app.schemas.pokemon import PokemonCreate, PokemonBase
 
+if TYPE_CHECKING:
+    # Importing the queue at runtime would build the app's async engine
+    from app.services.write_behind import PokemonWriteBehindQueue
+
 
 class PokemonService:
     """Service for fetching and managing Pokemon data"""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        write_behind: Optional["PokemonWriteBehindQueue"] = None,
+    ):
         self.db = db
+        self.write_behind = write_behind
         self.base_url = settings.pokemon_api_base_url
     
+    def _select_pokemon(
+        self, fields: Optional[Collection[str]] = None
+    ) -> Select[tuple[Pokemon]]:
+        """SELECT for Pokemon, narrowed to `fields` when given."""
+        stmt = select(Pokemon)
+        if fields:
+            stmt = stmt.options(
+                load_only(*(getattr(Pokemon, name) for name in fields))
+            )
+        return stmt
+    
     async def fetch_pokemon_from_api(self, pokemon_id: int) -> Optional[Dict[str, Any]]:
         """Fetch Pokemon data from PokeAPI"""
         async with httpx.AsyncClient() as client:
@@ -49,28 +71,53 @@ class PokemonService:
             sprite_back=sprites.get("back_default"),
         )
     
-    async def get_or_fetch_pokemon(self, pokemon_id: int) -> Optional[Pokemon]:
-        """Get Pokemon from DB or fetch from API if not found, then store."""
+    async def get_or_fetch_pokemon(
+        self,
+        pokemon_id: int,
+        fields: Optional[Collection[str]] = None,
+    ) -> Optional[Pokemon]:
+        """
+        Get Pokemon from DB or fetch from API if not found, then store.
+        
+        `fields` limits the columns loaded from the database; a Pokemon
+        fetched from the API is always returned in full.
+        """
         result = await self.db.execute(
-            select(Pokemon).where(Pokemon.pokemon_id == pokemon_id)
+            self._select_pokemon(fields).where(Pokemon.pokemon_id == pokemon_id)
         )
         pokemon = result.scalar_one_or_none()
         
         if pokemon:
             return pokemon
         
+        if self.write_behind is not None:
+            pending = self.write_behind.get(pokemon_id)
+            if pending:
+                return self._pending_pokemon(pending)
+        
         api_data = await self.fetch_pokemon_from_api(pokemon_id)
         if not api_data:
             return None
         
         pokemon_create_data = self.parse_pokemon_data(api_data)
         
+        if self.write_behind is not None:
+            if self.write_behind.enqueue(pokemon_create_data):
+                return self._pending_pokemon(pokemon_create_data)
+        
         new_pokemon = Pokemon(**pokemon_create_data.model_dump())
         self.db.add(new_pokemon)
         await self.db.commit()
         await self.db.refresh(new_pokemon)
         return new_pokemon
 
+    def _pending_pokemon(self, data: PokemonCreate) -> Pokemon:
+        """Build a transient Pokemon for a row queued for write-behind."""
+        now = datetime.now(timezone.utc)
+        return Pokemon(
+            **data.model_dump(mode="json"), created_at=now, updated_at=now
+        )
+
     async def fetch_and_upsert_pokemon(self, pokemon_id: int) -> Optional[Pokemon]:
         """Force fetch Pokemon from API and update or create in DB."""
         api_data = await self.fetch_pokemon_from_api(pokemon_id)
@@ -102,7 +149,8 @@ class PokemonService:
     async def get_pokemon_list(
         self, 
         skip: int = 0, 
-        limit: int = 10
+        limit: int = 10,
+        fields: Optional[Collection[str]] = None,
     ) -> tuple[List[Pokemon], int]:
         """Get list of Pokemon from database with total count."""
         total_result = await self.db.execute(select(func.count(Pokemon.id)))
@@ -112,15 +160,19 @@ class PokemonService:
             return [], 0
             
         list_result = await self.db.execute(
-            select(Pokemon).offset(skip).limit(limit)
+            self._select_pokemon(fields).offset(skip).limit(limit)
         )
         pokemon_list = list_result.scalars().all()
         
         return list(pokemon_list), total
     
-    async def search_pokemon_by_name(self, name: str) -> Optional[Pokemon]:
+    async def search_pokemon_by_name(
+        self,
+        name: str,
+        fields: Optional[Collection[str]] = None,
+    ) -> Optional[Pokemon]:
         """Search for a Pokemon by name (case-insensitive)."""
         result = await self.db.execute(
-            select(Pokemon).where(Pokemon.name == name.lower())
+            self._select_pokemon(fields).where(Pokemon.name == name.lower())
         )
         return result.scalar_one_or_none()
\ No newline at end of file
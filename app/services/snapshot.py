@@ -0,0 +1,180 @@
+import csv
+import io
+import json
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import (
+    JSON,
+    Connection,
+    DateTime,
+    Engine,
+    create_engine,
+    delete,
+    insert,
+    select,
+)
+from sqlalchemy.engine import make_url
+
+from app.db.base import Base
+from app.models.pokemon import Pokemon
+
+# File layout: magic, format version, row count, then a zlib-compressed JSON
+# object mapping each column name to the list of its values (columnar).
+SNAPSHOT_MAGIC = b"PKDX"
+SNAPSHOT_VERSION = 1
+_HEADER = struct.Struct(">4sBI")
+
+# Columns carried in a snapshot. The surrogate `id` is left to the target
+# database so its sequence stays consistent after the load.
+SNAPSHOT_COLUMNS = [
+    column.name for column in Pokemon.__table__.columns if column.name != "id"
+]
+_JSON_COLUMNS = {
+    column.name
+    for column in Pokemon.__table__.columns
+    if isinstance(column.type, JSON)
+}
+_DATETIME_COLUMNS = {
+    column.name
+    for column in Pokemon.__table__.columns
+    if isinstance(column.type, DateTime)
+}
+
+# Rows per executemany batch on backends without COPY.
+INSERT_BATCH_SIZE = 1000
+
+
+def sync_engine_from_url(database_url: str) -> Engine:
+    """Build a synchronous engine for an (optionally async) database URL"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        url = url.set(drivername="postgresql+psycopg2")
+    elif url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite")
+    return create_engine(url)
+
+
+class SnapshotService:
+    """Service for dumping and restoring the pokemon table as a binary snapshot"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def export_snapshot(self, path: Path) -> int:
+        """Write every stored Pokemon to `path`. Returns the number of rows."""
+        table = Pokemon.__table__
+        columns = [table.c[name] for name in SNAPSHOT_COLUMNS]
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(*columns).order_by(table.c.pokemon_id)
+            ).all()
+
+        data: Dict[str, List[Any]] = {name: [] for name in SNAPSHOT_COLUMNS}
+        for row in rows:
+            for name, value in zip(SNAPSHOT_COLUMNS, row):
+                if name in _DATETIME_COLUMNS:
+                    value = value.isoformat()
+                data[name].append(value)
+
+        payload = zlib.compress(
+            json.dumps(data, separators=(",", ":")).encode("utf-8"), level=9
+        )
+        path.write_bytes(
+            _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(rows)) + payload
+        )
+        return len(rows)
+
+    def import_snapshot(self, path: Path) -> int:
+        """
+        Replace the contents of the pokemon table with the snapshot at `path`.
+
+        Uses COPY on PostgreSQL and batched executemany elsewhere.
+        Returns the number of rows loaded.
+        """
+        columns = self.read_snapshot(path)
+        count = len(columns[SNAPSHOT_COLUMNS[0]])
+
+        Base.metadata.create_all(self.engine, tables=[Pokemon.__table__])
+        with self.engine.begin() as conn:
+            conn.execute(delete(Pokemon.__table__))
+            if count:
+                if self.engine.dialect.name == "postgresql":
+                    self._copy_rows(conn, columns, count)
+                else:
+                    self._insert_rows(conn, columns, count)
+        return count
+
+    @staticmethod
+    def read_snapshot(path: Path) -> Dict[str, List[Any]]:
+        """Read and validate a snapshot file, returning its columns"""
+        raw = path.read_bytes()
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"{path} is too short to be a Pokemon snapshot")
+
+        magic, version, count = _HEADER.unpack_from(raw)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a Pokemon snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version} "
+                f"(expected {SNAPSHOT_VERSION})"
+            )
+
+        try:
+            columns = json.loads(zlib.decompress(raw[_HEADER.size:]))
+        except (zlib.error, ValueError):
+            raise ValueError(f"{path} is a corrupt Pokemon snapshot") from None
+        if (
+            not isinstance(columns, dict)
+            or set(columns) != set(SNAPSHOT_COLUMNS)
+            or any(
+                not isinstance(values, list) or len(values) != count
+                for values in columns.values()
+            )
+        ):
+            raise ValueError(f"{path} is a corrupt Pokemon snapshot")
+        return columns
+
+    def _insert_rows(
+        self, conn: Connection, columns: Dict[str, List[Any]], count: int
+    ) -> None:
+        """Load rows with batched multi-parameter INSERTs"""
+        stmt = insert(Pokemon.__table__)
+        for start in range(0, count, INSERT_BATCH_SIZE):
+            batch = []
+            for i in range(start, min(start + INSERT_BATCH_SIZE, count)):
+                row = {name: columns[name][i] for name in SNAPSHOT_COLUMNS}
+                for name in _DATETIME_COLUMNS:
+                    row[name] = datetime.fromisoformat(row[name])
+                batch.append(row)
+            conn.execute(stmt, batch)
+
+    def _copy_rows(
+        self, conn: Connection, columns: Dict[str, List[Any]], count: int
+    ) -> None:
+        """Stream rows into PostgreSQL with COPY ... FROM STDIN"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for i in range(count):
+            record = []
+            for name in SNAPSHOT_COLUMNS:
+                value = columns[name][i]
+                if name in _JSON_COLUMNS:
+                    value = json.dumps(value)
+                record.append("" if value is None else value)
+            writer.writerow(record)
+        buffer.seek(0)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {Pokemon.__tablename__} ({', '.join(SNAPSHOT_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
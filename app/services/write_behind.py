@@ -0,0 +1,214 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import engine
+from app.models.pokemon import Pokemon
+from app.schemas.pokemon import PokemonCreate
+
+logger = logging.getLogger(__name__)
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING. Rows written behind
+# may race with POST /fetch, so other dialects are not supported.
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class PokemonWriteBehindQueue:
+    """
+    In-process queue of freshly fetched Pokemon awaiting persistence.
+
+    Entries are keyed by pokemon_id, so a Pokemon is only ever queued once.
+    A background task drains the queue in batched multi-row INSERTs; rows
+    stay visible through `get` until their batch has been committed. When a
+    batch fails its rows are retried one at a time, so only a row that keeps
+    failing uses up its `max_attempts` and is dropped.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        max_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_attempts: int = 3,
+        max_backoff: float = 30.0,
+    ):
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self._pending: Dict[int, PokemonCreate] = {}
+        self._attempts: Dict[int, int] = {}
+        # Created in `start` so it belongs to the running event loop
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flush task is active"""
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, pokemon_id: int) -> Optional[PokemonCreate]:
+        """Return the queued Pokemon with this ID, if it is still pending."""
+        return self._pending.get(pokemon_id)
+
+    def enqueue(self, pokemon: PokemonCreate) -> bool:
+        """
+        Queue a Pokemon for persistence.
+
+        Returns False when the queue is full, in which case the caller is
+        expected to write the row itself.
+        """
+        if pokemon.pokemon_id in self._pending:
+            return True
+        if len(self._pending) >= self.max_size:
+            return False
+
+        self._pending[pokemon.pokemon_id] = pokemon
+        if self._wakeup is not None and len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    async def start(self) -> None:
+        """Start the background flush task"""
+        if self.running:
+            return
+
+        dialect = self.engine.dialect.name
+        if dialect not in _INSERTS:
+            raise ValueError(
+                f"Write-behind is not supported on the {dialect!r} dialect"
+            )
+
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(self._wakeup))
+
+    async def stop(self) -> None:
+        """Stop the background task and flush everything still queued"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Write-behind task had already failed")
+        self._wakeup = None
+
+        await self.flush()
+        if self._pending:
+            logger.error(
+                "Write-behind flush on shutdown could not persist %d rows: %s",
+                len(self._pending), list(self._pending),
+            )
+            self._pending.clear()
+            self._attempts.clear()
+
+    async def flush(self) -> int:
+        """
+        Make one attempt at writing every pending Pokemon.
+
+        A failed batch is retried row by row, so a bad row never holds back
+        the others. Rows that still fail stay queued until they run out of
+        attempts. Returns the number of rows written.
+        """
+        flushed, _ = await self._flush()
+        return flushed
+
+    async def _flush(self) -> tuple[int, int]:
+        """Flush pending rows, returning (rows written, rows failed)."""
+        pending = list(self._pending.values())
+        flushed = failed = 0
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            try:
+                await self._write_batch(batch)
+            except Exception:
+                logger.warning(
+                    "Write-behind batch of %d rows failed; retrying rows singly",
+                    len(batch),
+                    exc_info=True,
+                )
+                for pokemon in batch:
+                    try:
+                        await self._write_batch([pokemon])
+                    except Exception:
+                        self._record_failure(pokemon)
+                        failed += 1
+                    else:
+                        self._discard(pokemon)
+                        flushed += 1
+            else:
+                for pokemon in batch:
+                    self._discard(pokemon)
+                flushed += len(batch)
+        return flushed, failed
+
+    def _discard(self, pokemon: PokemonCreate) -> None:
+        self._pending.pop(pokemon.pokemon_id, None)
+        self._attempts.pop(pokemon.pokemon_id, None)
+
+    def _record_failure(self, pokemon: PokemonCreate) -> None:
+        """Count a failed attempt for `pokemon`, dropping it when out of attempts."""
+        attempts = self._attempts.get(pokemon.pokemon_id, 0) + 1
+        if attempts < self.max_attempts:
+            self._attempts[pokemon.pokemon_id] = attempts
+            return
+
+        self._discard(pokemon)
+        logger.error(
+            "Dropping write-behind row for pokemon_id %d after %d failed attempts",
+            pokemon.pokemon_id, attempts,
+        )
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        failures = 0
+        while True:
+            delay = self.flush_interval
+            if failures:
+                delay = min(self.flush_interval * 2 ** failures, self.max_backoff)
+            try:
+                await asyncio.wait_for(wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            try:
+                _, failed = await self._flush()
+            except Exception:
+                logger.exception("Write-behind flush failed; will retry")
+                failed = 1
+            failures = failures + 1 if failed else 0
+
+    async def _write_batch(self, batch: List[PokemonCreate]) -> None:
+        rows = [pokemon.model_dump(mode="json") for pokemon in batch]
+        insert = _INSERTS[self.engine.dialect.name]
+        stmt = insert(Pokemon).values(rows).on_conflict_do_nothing(
+            index_elements=["pokemon_id"]
+        )
+        async with self.session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+
+write_behind_queue = PokemonWriteBehindQueue(
+    engine,
+    max_size=settings.write_behind_max_size,
+    batch_size=settings.write_behind_batch_size,
+    flush_interval=settings.write_behind_flush_interval,
+)
@@ -1,5 +1,55 @@
+import argparse
+import time
+from pathlib import Path
+
+from app.core.config import settings
+from app.services.snapshot import SnapshotService, sync_engine_from_url
+
+
+def snapshot_export(args: argparse.Namespace) -> None:
+    """Dump the pokemon table to a snapshot file"""
+    service = SnapshotService(sync_engine_from_url(args.database_url))
+    start = time.perf_counter()
+    count = service.export_snapshot(args.path)
+    elapsed = time.perf_counter() - start
+    print(f"Exported {count} Pokemon to {args.path} in {elapsed:.3f}s")
+
+
+def snapshot_import(args: argparse.Namespace) -> None:
+    """Replace the pokemon table with the contents of a snapshot file"""
+    service = SnapshotService(sync_engine_from_url(args.database_url))
+    start = time.perf_counter()
+    count = service.import_snapshot(args.path)
+    elapsed = time.perf_counter() - start
+    print(f"Imported {count} Pokemon from {args.path} in {elapsed:.3f}s")
+
+
 def main():
-    print("Hello from github-actions-python-fastapi!")
+    parser = argparse.ArgumentParser(description="Pokemon API management commands")
+    parser.add_argument(
+        "--database-url",
+        default=settings.database_url,
+        help="Database to operate on (defaults to DATABASE_URL)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser(
+        "snapshot-export", help="Dump the pokemon table to a binary snapshot"
+    )
+    export_parser.add_argument("path", type=Path, help="Snapshot file to write")
+    export_parser.set_defaults(handler=snapshot_export)
+
+    import_parser = commands.add_parser(
+        "snapshot-import", help="Load a binary snapshot into the pokemon table"
+    )
+    import_parser.add_argument("path", type=Path, help="Snapshot file to read")
+    import_parser.set_defaults(handler=snapshot_import)
+
+    args = parser.parse_args()
+    try:
+        args.handler(args)
+    except (ValueError, OSError) as exc:
+        parser.exit(1, f"error: {exc}\n")
 
 
 if __name__ == "__main__":
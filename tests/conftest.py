@@ -1,8 +1,14 @@
 import asyncio
 import pytest
+from pathlib import Path
 from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
 from sqlalchemy.pool import NullPool
 
 from app.main import app
@@ -71,4 +77,25 @@ def client(db_session: AsyncSession) -> Generator[TestClient, None, None]:
         yield test_client
     
     # Clear the dependency overrides after the test is done
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+async def db_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """Create an engine for a file-based SQLite database with the schema."""
+    # A file database shares its schema across connections, so code that opens
+    # its own sessions (e.g. background tasks) sees the tables too.
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool, # Connections must not outlive a TestClient's event loop
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def session_factory(db_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create a session factory bound to the file-based test database."""
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
\ No newline at end of file
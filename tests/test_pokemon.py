@@ -1,9 +1,14 @@
 import pytest
+from typing import AsyncGenerator
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.session import get_db
+from app.main import app
 from app.models.pokemon import Pokemon
+from app.schemas.pokemon import POKEMON_FIELDS, pokemon_fields_model
 from app.services.pokemon import PokemonService
 
 
@@ -67,4 +72,105 @@ def test_search_pokemon_not_found(client: TestClient):
     """Test searching for a Pokemon that doesn't exist"""
     response = client.get("/api/v1/pokemon/search/unknown")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
\ No newline at end of file
+    assert "not found" in response.json()["detail"].lower()
+
+
+def test_get_pokemon_unknown_fields(client: TestClient):
+    """Test that unknown sparse fieldset names are rejected"""
+    response = client.get("/api/v1/pokemon/1?fields=name,secret")
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+
+def test_pokemon_fields_model():
+    """Test the sparse response schema only serializes requested fields"""
+    model = pokemon_fields_model(frozenset({"pokemon_id", "name", "types"}))
+    pokemon = Pokemon(pokemon_id=1, name="bulbasaur", types=["grass"])
+    assert model.model_validate(pokemon).model_dump() == {
+        "pokemon_id": 1,
+        "name": "bulbasaur",
+        "types": ["grass"],
+    }
+
+
+async def add_bulbasaur(session_factory) -> None:
+    async with session_factory() as session:
+        session.add(Pokemon(
+            pokemon_id=1,
+            name="bulbasaur",
+            height=0.7,
+            weight=6.9,
+            base_experience=64,
+            types=["grass"],
+            abilities=["overgrow"],
+            stats={"hp": 45},
+            sprite_front="https://example.com/sprite.png",
+        ))
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_pokemon_service_sparse_fields(session_factory):
+    """Test that a fields selection narrows the columns loaded from the DB"""
+    await add_bulbasaur(session_factory)
+
+    async with session_factory() as session:
+        service = PokemonService(session)
+        pokemon_list, total = await service.get_pokemon_list(fields={"name", "types"})
+        assert total == 1
+        unloaded = inspect(pokemon_list[0]).unloaded
+        assert "stats" in unloaded and "sprite_front" in unloaded
+        assert "name" not in unloaded and "types" not in unloaded
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields_endpoints(session_factory):
+    """Test that ?fields= returns only the requested keys on get, list and search"""
+    await add_bulbasaur(session_factory)
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as client:
+            response = client.get("/api/v1/pokemon/1?fields=pokemon_id,name,types")
+            assert response.status_code == 200
+            assert response.json() == {
+                "pokemon_id": 1,
+                "name": "bulbasaur",
+                "types": ["grass"],
+            }
+
+            response = client.get("/api/v1/pokemon/?fields=pokemon_id,name")
+            assert response.status_code == 200
+            assert response.json() == {
+                "items": [{"pokemon_id": 1, "name": "bulbasaur"}],
+                "total": 1,
+                "page": 1,
+                "size": 10,
+            }
+
+            response = client.get("/api/v1/pokemon/search/bulbasaur?fields=id,stats")
+            assert response.status_code == 200
+            assert response.json() == {"id": 1, "stats": {"hp": 45}}
+
+            # Without fields= every field is still returned
+            response = client.get("/api/v1/pokemon/1")
+            assert set(response.json()) == set(POKEMON_FIELDS)
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_sparse_fields_documented_in_openapi():
+    """Test the OpenAPI schema notes that fields= narrows the response"""
+    paths = app.openapi()["paths"]
+    for path in (
+        "/api/v1/pokemon/{pokemon_id}",
+        "/api/v1/pokemon/",
+        "/api/v1/pokemon/search/{name}",
+    ):
+        responses = paths[path]["get"]["responses"]
+        assert "only the requested keys" in responses["200"]["description"]
+        assert "400" in responses
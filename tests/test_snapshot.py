@@ -0,0 +1,142 @@
+import json
+import pytest
+import struct
+import zlib
+from pathlib import Path
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.pokemon import Pokemon
+from app.services.snapshot import (
+    SNAPSHOT_COLUMNS,
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    SnapshotService,
+    sync_engine_from_url,
+)
+
+
+def make_pokemon(pokemon_id: int, name: str) -> Pokemon:
+    return Pokemon(
+        pokemon_id=pokemon_id,
+        name=name,
+        height=0.7,
+        weight=6.9,
+        base_experience=64,
+        types=["grass", "poison"],
+        abilities=["overgrow"],
+        stats={"hp": 45, "attack": 49},
+        sprite_front="https://example.com/front.png",
+        sprite_back=None,
+    )
+
+
+def test_snapshot_round_trip(tmp_path: Path):
+    """Test exporting a snapshot and restoring it into an empty database"""
+    source = sync_engine_from_url(f"sqlite+aiosqlite:///{tmp_path / 'source.db'}")
+    Base.metadata.create_all(source)
+    with Session(source) as session:
+        session.add_all([make_pokemon(1, "bulbasaur"), make_pokemon(4, "charmander")])
+        session.commit()
+
+    snapshot_path = tmp_path / "dex.snapshot"
+    assert SnapshotService(source).export_snapshot(snapshot_path) == 2
+
+    target = sync_engine_from_url(f"sqlite:///{tmp_path / 'target.db'}")
+    assert SnapshotService(target).import_snapshot(snapshot_path) == 2
+
+    with Session(target) as session:
+        restored = session.scalars(select(Pokemon).order_by(Pokemon.pokemon_id)).all()
+    assert [p.name for p in restored] == ["bulbasaur", "charmander"]
+    assert restored[0].types == ["grass", "poison"]
+    assert restored[0].stats == {"hp": 45, "attack": 49}
+    assert restored[0].sprite_back is None
+    assert restored[0].created_at is not None
+
+    # Importing again replaces rather than duplicates the table contents
+    assert SnapshotService(target).import_snapshot(snapshot_path) == 2
+
+
+def test_snapshot_rejects_foreign_file(tmp_path: Path):
+    """Test that files without the snapshot header are refused"""
+    bogus = tmp_path / "bogus.snapshot"
+    bogus.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError, match="not a Pokemon snapshot"):
+        SnapshotService.read_snapshot(bogus)
+
+
+def test_snapshot_rejects_corrupt_body(tmp_path: Path):
+    """Test that a valid header with an undecodable body is refused"""
+    corrupt = tmp_path / "corrupt.snapshot"
+    header = struct.pack(">4sBI", SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 1)
+    corrupt.write_bytes(header + b"definitely not zlib")
+    with pytest.raises(ValueError, match="corrupt Pokemon snapshot"):
+        SnapshotService.read_snapshot(corrupt)
+
+
+def test_snapshot_rejects_non_list_columns(tmp_path: Path):
+    """Test that a decodable body whose columns are not lists is refused"""
+    corrupt = tmp_path / "corrupt.snapshot"
+    header = struct.pack(">4sBI", SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 1)
+    body = json.dumps({name: 1 for name in SNAPSHOT_COLUMNS}).encode("utf-8")
+    corrupt.write_bytes(header + zlib.compress(body))
+    with pytest.raises(ValueError, match="corrupt Pokemon snapshot"):
+        SnapshotService.read_snapshot(corrupt)
+
+
+class StubCursor:
+    """Cursor stand-in that records what COPY would receive"""
+
+    def __init__(self):
+        self.sql = None
+        self.data = None
+        self.closed = False
+
+    def copy_expert(self, sql, file):
+        self.sql = sql
+        self.data = file.read()
+
+    def close(self):
+        self.closed = True
+
+
+class StubConnection:
+    def __init__(self, cursor: StubCursor):
+        self.connection = self
+        self._cursor = cursor
+
+    def cursor(self) -> StubCursor:
+        return self._cursor
+
+
+def test_snapshot_copy_rows_csv():
+    """Test the CSV fed to PostgreSQL COPY for JSON, NULL and timestamp values"""
+    columns = {
+        "pokemon_id": [1],
+        "name": ["bulbasaur"],
+        "height": [0.7],
+        "weight": [6.9],
+        "base_experience": [64],
+        "types": [["grass", "poison"]],
+        "abilities": [["overgrow"]],
+        "stats": [{"hp": 45}],
+        "sprite_front": ["https://example.com/front.png"],
+        "sprite_back": [None],
+        "created_at": ["2024-01-01T00:00:00+00:00"],
+        "updated_at": ["2024-01-02T00:00:00+00:00"],
+    }
+    cursor = StubCursor()
+    SnapshotService(None)._copy_rows(StubConnection(cursor), columns, 1)
+
+    assert cursor.sql == (
+        "COPY pokemon (pokemon_id, name, height, weight, base_experience, types, "
+        "abilities, stats, sprite_front, sprite_back, created_at, updated_at) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    assert cursor.data == (
+        '1,bulbasaur,0.7,6.9,64,"[""grass"", ""poison""]","[""overgrow""]",'
+        '"{""hp"": 45}",https://example.com/front.png,,'
+        "2024-01-01T00:00:00+00:00,2024-01-02T00:00:00+00:00\r\n"
+    )
+    assert cursor.closed
@@ -0,0 +1,190 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import get_db
+from app.main import app
+from app.models.pokemon import Pokemon
+from app.schemas.pokemon import PokemonCreate
+from app.services.pokemon import PokemonService
+from app.services.write_behind import PokemonWriteBehindQueue, write_behind_queue
+
+MOCK_API_DATA = {
+    "id": 1,
+    "name": "bulbasaur",
+    "height": 7,
+    "weight": 69,
+    "base_experience": 64,
+    "types": [{"slot": 1, "type": {"name": "grass"}}],
+    "abilities": [{"slot": 1, "ability": {"name": "overgrow"}, "is_hidden": False}],
+    "stats": [{"stat": {"name": "hp"}, "base_stat": 45, "effort": 0}],
+    "sprites": {"front_default": "https://example.com/sprite.png", "back_default": None},
+}
+
+
+def make_create(pokemon_id: int) -> PokemonCreate:
+    return PokemonCreate(
+        pokemon_id=pokemon_id,
+        name=f"pokemon-{pokemon_id}",
+        height=1.0,
+        weight=1.0,
+        base_experience=1,
+        types=["normal"],
+        abilities=["run-away"],
+        stats={"hp": 1},
+    )
+
+
+async def count_pokemon(session_factory) -> int:
+    async with session_factory() as session:
+        return (await session.execute(select(func.count(Pokemon.id)))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_write_behind_suppresses_duplicates_and_limits_size(db_engine, session_factory):
+    """Test duplicate pokemon_ids are queued once and the size limit holds"""
+    queue = PokemonWriteBehindQueue(db_engine, max_size=2)
+    assert queue.enqueue(make_create(1))
+    assert queue.enqueue(make_create(1))
+    assert queue.enqueue(make_create(2))
+    assert not queue.enqueue(make_create(3))
+    assert len(queue) == 2
+
+
+@pytest.mark.asyncio
+async def test_write_behind_flush_batches_rows(db_engine, session_factory):
+    """Test flush persists all queued rows and skips existing ones"""
+    queue = PokemonWriteBehindQueue(db_engine, batch_size=2)
+    for pokemon_id in range(1, 6):
+        queue.enqueue(make_create(pokemon_id))
+
+    assert await queue.flush() == 5
+    assert len(queue) == 0
+    assert await count_pokemon(session_factory) == 5
+
+    # A row already in the database is ignored rather than failing the batch
+    queue.enqueue(make_create(1))
+    queue.enqueue(make_create(6))
+    await queue.stop()
+    assert await count_pokemon(session_factory) == 6
+
+
+@pytest.mark.asyncio
+async def test_get_or_fetch_pokemon_write_behind(db_engine, session_factory):
+    """Test a miss is answered from the upstream payload and queued"""
+    queue = PokemonWriteBehindQueue(db_engine)
+    async with session_factory() as session:
+        service = PokemonService(session, write_behind=queue)
+        service.fetch_pokemon_from_api = AsyncMock(return_value=MOCK_API_DATA)
+
+        pokemon = await service.get_or_fetch_pokemon(1)
+        assert pokemon.name == "bulbasaur"
+        assert pokemon.id is None
+        assert queue.get(1) is not None
+        assert await count_pokemon(session_factory) == 0
+
+        # A second miss is served from the queue without another upstream call
+        await service.get_or_fetch_pokemon(1)
+        service.fetch_pokemon_from_api.assert_awaited_once()
+
+    await queue.stop()
+    assert await count_pokemon(session_factory) == 1
+
+
+def fail_for(queue: PokemonWriteBehindQueue, bad_ids: set) -> None:
+    """Make every write that includes one of `bad_ids` fail"""
+    original_write = queue._write_batch
+
+    async def failing_write(batch):
+        if any(pokemon.pokemon_id in bad_ids for pokemon in batch):
+            raise RuntimeError("boom")
+        await original_write(batch)
+
+    queue._write_batch = failing_write
+
+
+@pytest.mark.asyncio
+async def test_write_behind_isolates_bad_row(db_engine, session_factory):
+    """Test a bad row only costs its own attempts, not its batch-mates'"""
+    queue = PokemonWriteBehindQueue(db_engine, batch_size=5, max_attempts=2)
+    for pokemon_id in range(1, 6):
+        queue.enqueue(make_create(pokemon_id))
+    fail_for(queue, {3})
+
+    assert await queue.flush() == 4
+    assert await count_pokemon(session_factory) == 4
+    assert queue.get(3) is not None
+
+    assert await queue.flush() == 0
+    assert queue.get(3) is None
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_write_behind_stop_writes_past_poison_batch(db_engine, session_factory):
+    """Test shutdown keeps flushing the batches after one that fails"""
+    queue = PokemonWriteBehindQueue(db_engine, batch_size=1)
+    for pokemon_id in range(1, 6):
+        queue.enqueue(make_create(pokemon_id))
+    fail_for(queue, {1})
+
+    await queue.stop()
+    assert await count_pokemon(session_factory) == 4
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_write_behind_start_rejects_unsupported_dialect():
+    """Test start refuses dialects without ON CONFLICT DO NOTHING"""
+    engine = SimpleNamespace(dialect=SimpleNamespace(name="mssql"))
+    queue = PokemonWriteBehindQueue(engine)
+    with pytest.raises(ValueError, match="not supported"):
+        await queue.start()
+    assert not queue.running
+
+
+def test_write_behind_lifespan(db_engine, session_factory, monkeypatch):
+    """Test the app lifespan starts write-behind and drains it on shutdown"""
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr(settings, "write_behind_enabled", True)
+    monkeypatch.setattr(write_behind_queue, "engine", db_engine)
+    monkeypatch.setattr(write_behind_queue, "session_factory", session_factory)
+    # Flush only on shutdown, so the rows below are still queued at that point
+    monkeypatch.setattr(write_behind_queue, "flush_interval", 60)
+    app.dependency_overrides[get_db] = override_get_db
+
+    try:
+        # Run the app twice in one process, each run on a fresh event loop
+        for pokemon_id in (1, 2):
+            api_data = {**MOCK_API_DATA, "id": pokemon_id}
+            with patch.object(
+                PokemonService,
+                "fetch_pokemon_from_api",
+                AsyncMock(return_value=api_data),
+            ):
+                with TestClient(app) as client:
+                    assert write_behind_queue.running
+                    response = client.get(f"/api/v1/pokemon/{pokemon_id}")
+                    assert response.status_code == 200
+                    assert response.json()["id"] is None
+                    assert write_behind_queue.get(pokemon_id) is not None
+            assert not write_behind_queue.running
+            assert len(write_behind_queue) == 0
+    finally:
+        app.dependency_overrides.clear()
+
+    async def persisted_ids():
+        async with session_factory() as session:
+            return (await session.execute(select(Pokemon.pokemon_id))).scalars().all()
+
+    assert sorted(asyncio.run(persisted_ids())) == [1, 2]